@@ -3,12 +3,14 @@
 
 """Module of the base class."""
 
+import sys
+import copy
+import time
 import shlex
 import signal
+import itertools
 import traceback
 import argparse
-import numbers
-from datetime import datetime
 from operator import attrgetter
 from abc import ABC, abstractmethod
 
@@ -18,6 +20,14 @@
 from superbench.benchmarks import BenchmarkType, ReturnCode
 from superbench.benchmarks.result import BenchmarkResult
 
+# Concrete numeric types accepted in results, bool is covered by int.
+_NUMERIC_TYPES = (int, float, np.number)
+# Benchmark types whose raw data is allowed to be List[str] and List[List[Number]] respectively.
+_STR_RAW_DATA_TYPES = frozenset({BenchmarkType.DOCKER, BenchmarkType.MICRO})
+_NUMERIC_RAW_DATA_TYPES = frozenset({BenchmarkType.MODEL, BenchmarkType.MICRO})
+# Characters which need shlex to split parameters, otherwise splitting by whitespace is enough.
+_QUOTE_CHARS = frozenset('\'"\\')
+
 
 class SortedMetavarTypeHelpFormatter(argparse.MetavarTypeHelpFormatter):
     """Custom HelpFormatter class for argparse which sorts option strings."""
@@ -32,6 +42,18 @@ def add_arguments(self, actions):
 
 class Benchmark(ABC):
     """The base class of all benchmarks."""
+    __slots__ = (
+        '_name', '_argv', '_benchmark_type', '_parser', '_args', '_curr_run_index', '_result', '_start_time',
+        '_end_time'
+    )
+
+    # Parser populated by add_parser_arguments(), built once and cached per benchmark class.
+    _parser_template = None
+    # Argument actions of the parser template used by the fast parsing path, cached per benchmark class.
+    _arg_specs = None
+    # Formatted help message of the parser template, cached per benchmark class.
+    _configurable_settings = None
+
     def __init__(self, name, parameters=''):
         """Constructor.
 
@@ -40,22 +62,174 @@ def __init__(self, name, parameters=''):
             parameters (str): benchmark parameters.
         """
         self._name = name
-        self._argv = list(filter(None, shlex.split(parameters))) if parameters is not None else list()
+        if not parameters:
+            self._argv = list()
+        elif _QUOTE_CHARS.isdisjoint(parameters):
+            self._argv = parameters.split()
+        else:
+            self._argv = list(filter(None, shlex.split(parameters)))
         self._benchmark_type = None
-        self._parser = argparse.ArgumentParser(
+        self._parser = None
+        self._args = None
+        self._curr_run_index = 0
+        self._result = None
+
+    @staticmethod
+    def _create_parser():
+        """Create an empty argument parser.
+
+        Return:
+            parser (argparse.ArgumentParser): the argument parser without any argument.
+        """
+        kwargs = dict()
+        # Disable colorized help in Python 3.14, which probes the terminal in every formatter
+        # and would put escape codes into the configurable settings.
+        if sys.version_info >= (3, 14):
+            kwargs['color'] = False
+        parser = argparse.ArgumentParser(
             add_help=False,
             usage=argparse.SUPPRESS,
             allow_abbrev=False,
             formatter_class=SortedMetavarTypeHelpFormatter,
+            **kwargs,
         )
         # Fix optionals title in Python 3.10
-        self._parser._optionals.title = 'optional arguments'
-        self._args = None
-        self._curr_run_index = 0
-        self._result = None
+        parser._optionals.title = 'optional arguments'
+        return parser
+
+    def _get_parser_template(self):
+        """Get the parser template of the benchmark class.
+
+        The template is built by add_parser_arguments() the first time it is needed,
+        and then reused by all instances of the same class.
+
+        Return:
+            parser (argparse.ArgumentParser): the argument parser with all arguments added.
+        """
+        cls = type(self)
+        if cls.__dict__.get('_parser_template') is None:
+            parser, self._parser = self._parser, self._create_parser()
+            try:
+                self.add_parser_arguments()
+                cls._parser_template = self._parser
+            finally:
+                self._parser = parser
+        return cls._parser_template
+
+    def _get_arg_specs(self):
+        """Get the argument specs of the benchmark class for the fast parsing path.
+
+        Return:
+            actions (list): all argument actions of the parser template.
+            options (dict): option string to action, only for actions which can be parsed without argparse.
+        """
+        cls = type(self)
+        if cls.__dict__.get('_arg_specs') is None:
+            template = self._get_parser_template()
+            options = dict()
+            for action in template._actions:
+                if type(action) is argparse._StoreAction and action.nargs in [None, '+', '*'] or \
+                        type(action) in [argparse._StoreTrueAction, argparse._StoreFalseAction]:
+                    for option in action.option_strings:
+                        options[option] = action
+            cls._arg_specs = (list(template._actions), options)
+        return cls._arg_specs
+
+    def _fast_parse(self):
+        """Parse simple '--name value' and '--name=value' style arguments without argparse.
+
+        Return:
+            args (argparse.Namespace): parsed arguments, None if the arguments need to be parsed by argparse.
+        """
+        actions, options = self._get_arg_specs()
+        collected = self.__collect_fast_args(options)
+        if collected is None:
+            return None
+
+        values = dict()
+        for action, strings in collected:
+            ret, values[action.dest] = self.__convert_fast_arg(action, strings)
+            if not ret:
+                return None
+
+        args = argparse.Namespace()
+        for action in actions:
+            if action.dest not in values and \
+                    (action.required or isinstance(action.default, str) and action.type not in [None, str]):
+                return None
+            if not hasattr(args, action.dest) and action.default is not argparse.SUPPRESS:
+                setattr(args, action.dest, action.default)
+        for dest, value in values.items():
+            setattr(args, dest, value)
+
+        return args
+
+    def __collect_fast_args(self, options):
+        """Collect the value strings of each option in self._argv for the fast parsing path.
+
+        Args:
+            options (dict): option string to action which can be parsed without argparse.
+
+        Return:
+            collected (list): list of (action, value strings), None if any option is not supported.
+        """
+        collected = list()
+        argv = self._argv
+        i, n = 0, len(argv)
+        while i < n:
+            option, sep, value = argv[i].partition('=')
+            action = options.get(option)
+            if action is None or (sep and action.nargs is not None):
+                return None
+            i += 1
+            if sep:
+                strings = [value]
+            else:
+                k = i
+                while k < n and action.nargs != 0 and not argv[k].startswith('-'):
+                    k += 1
+                    if action.nargs is None:
+                        break
+                strings, i = argv[i:k], k
+            collected.append((action, strings))
+
+        return collected
+
+    def __convert_fast_arg(self, action, strings):
+        """Convert the value strings of one option for the fast parsing path.
+
+        Args:
+            action (argparse.Action): the action of the option.
+            strings (list): value strings of the option.
+
+        Return:
+            ret (bool): whether the values are converted successfully.
+            value (object): the converted value.
+        """
+        if action.nargs == 0:
+            return True, action.const
+        if len(strings) == 0 and action.nargs != '*':
+            return False, None
+        try:
+            converted = [action.type(string) if action.type else string for string in strings]
+        except (TypeError, ValueError, argparse.ArgumentTypeError):
+            return False, None
+        if action.choices is not None and any(item not in action.choices for item in converted):
+            return False, None
+
+        return True, converted[0] if action.nargs is None else converted
+
+    def _init_parser(self):
+        """Initialize the argument parser of the instance from the parser template."""
+        if self._parser is None:
+            self._parser = copy.deepcopy(self._get_parser_template())
 
     def add_parser_arguments(self):
-        """Add the specified arguments."""
+        """Add the specified arguments.
+
+        It is invoked once per benchmark class to build the parser template,
+        so it should only add arguments into self._parser.
+        """
         self._parser.add_argument(
             '--run_count',
             type=int,
@@ -82,6 +256,12 @@ def add_parser_arguments(self):
             default=False,
             help='Real-time log flushing.',
         )
+        self._parser.add_argument(
+            '--skip_result_check',
+            action='store_true',
+            default=False,
+            help='Skip checking the values of result and raw data.',
+        )
 
     def get_configurable_settings(self):
         """Get all the configurable settings.
@@ -89,8 +269,10 @@ def get_configurable_settings(self):
         Return:
             All configurable settings in raw string.
         """
-        message = self._parser.format_help().strip()
-        return message
+        cls = type(self)
+        if cls.__dict__.get('_configurable_settings') is None:
+            cls._configurable_settings = self._get_parser_template().format_help().strip()
+        return cls._configurable_settings
 
     def parse_args(self, ignore_invalid=False):
         """Parse the arguments.
@@ -100,6 +282,11 @@ def parse_args(self, ignore_invalid=False):
             args (argparse.Namespace): parsed arguments.
             unknown (list): unknown arguments.
         """
+        args = self._fast_parse()
+        if args is not None:
+            return True, args, []
+
+        self._init_parser()
         try:
             args, unknown = self._parser.parse_known_args(self._argv)
         except BaseException as e:
@@ -125,25 +312,22 @@ def _preprocess(self):
         Return:
             True if _preprocess() succeed.
         """
-        self.add_parser_arguments()
         ret, self._args, unknown = self.parse_args()
 
         if not ret:
             self._result = BenchmarkResult(self._name, self._benchmark_type, ReturnCode.INVALID_ARGUMENT)
             return False
 
-        self._result = BenchmarkResult(
-            self._name, self._benchmark_type, ReturnCode.SUCCESS, run_count=self._args.run_count
-        )
-
+        return_code = ReturnCode.SUCCESS
         if not isinstance(self._benchmark_type, BenchmarkType):
             logger.error(
                 'Invalid benchmark type - benchmark: {}, type: {}'.format(self._name, type(self._benchmark_type))
             )
-            self._result.set_return_code(ReturnCode.INVALID_BENCHMARK_TYPE)
-            return False
+            return_code = ReturnCode.INVALID_BENCHMARK_TYPE
 
-        return True
+        self._result = BenchmarkResult(self._name, self._benchmark_type, return_code, run_count=self._args.run_count)
+
+        return return_code == ReturnCode.SUCCESS
 
     def _postprocess(self):
         """Postprocess/cleanup operations after the benchmarking.
@@ -165,13 +349,14 @@ def run(self):
             True if run benchmark successfully.
         """
         ret = True
-        self._start_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        self._start_time = time.time()
         try:
             ret &= self._preprocess()
             if ret:
                 signal.signal(signal.SIGTERM, self.__signal_handler)
+                benchmark = self._benchmark
                 for self._curr_run_index in range(self._args.run_count):
-                    ret &= self._benchmark()
+                    ret &= benchmark()
                 if ret:
                     ret &= self.__check_result_format()
         except TimeoutError as e:
@@ -183,11 +368,73 @@ def run(self):
         else:
             ret &= self._postprocess()
         finally:
-            self._end_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
-            self._result.set_timestamp(self._start_time, self._end_time)
+            self._end_time = time.time()
+            self._result.set_timestamp(
+                self.__format_timestamp(self._start_time), self.__format_timestamp(self._end_time)
+            )
 
         return ret
 
+    @classmethod
+    def run_many(cls, name, param_grid, parameters=''):
+        """Launch the benchmarking once for each parameter set in the grid.
+
+        All runs share the parser template of the benchmark class, and each parameter set is converted
+        into arguments directly instead of being formatted into a parameter string and split again.
+
+        Args:
+            name (str): benchmark name.
+            param_grid (list[dict]): parameter sets, key is the argument name and value is the argument value.
+            parameters (str): common benchmark parameters for all parameter sets, e.g., predefined parameters.
+
+        Return:
+            benchmarks (list[Benchmark]): benchmark instances which contain the results, in the order of param_grid.
+        """
+        benchmarks = list()
+        for params in param_grid:
+            benchmark = cls(name, parameters)
+            benchmark._argv.extend(cls.__params_to_argv(params))
+            benchmark.run()
+            benchmarks.append(benchmark)
+
+        return benchmarks
+
+    @staticmethod
+    def __params_to_argv(params):
+        """Convert parameters dict into command line arguments.
+
+        Args:
+            params (dict): parameters, key is the argument name and value is the argument value.
+
+        Return:
+            argv (list): command line arguments.
+        """
+        argv = list()
+        for name, val in params.items():
+            if val is None:
+                continue
+            if isinstance(val, bool):
+                if val:
+                    argv.append('--{}'.format(name))
+            elif isinstance(val, (list, tuple)):
+                argv.append('--{}'.format(name))
+                argv.extend(str(item) for item in val)
+            else:
+                argv.extend(['--{}'.format(name), str(val)])
+
+        return argv
+
+    def __format_timestamp(self, timestamp):
+        """Format the timestamp in UTC.
+
+        Args:
+            timestamp (float): seconds since the epoch.
+
+        Return:
+            The formatted timestamp string.
+        """
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(timestamp))
+
     def __signal_handler(self, signum, frame):
         """Signal handler for benchmark.
 
@@ -203,10 +450,13 @@ def __signal_handler(self, signum, frame):
     def __check_result_format(self):
         """Check the validation of result object.
 
+        The values of summarized result and raw data are walked one by one,
+        which is skipped if --skip_result_check is set.
+
         Return:
             True if the result is valid.
         """
-        if (not self.__check_result_type()) or (not self.__check_summarized_result()) or (not self.__check_raw_data()):
+        if (not self.__check_result_type()) or (not self._args.skip_result_check and not self.__check_result_values()):
             self._result.set_return_code(ReturnCode.INVALID_BENCHMARK_RESULT)
             return False
 
@@ -227,55 +477,41 @@ def __check_result_type(self):
         return True
 
     def __is_list_type(self, data, t):
-        if isinstance(data, list) and all(isinstance(item, t) for item in data):
-            return True
-        return False
+        return isinstance(data, list) and all(isinstance(item, t) for item in data)
 
     def __is_list_list_type(self, data, t):
-        if (self.__is_list_type(data, list) and all(isinstance(value, t) for item in data for value in item)):
-            return True
-        return False
+        return self.__is_list_type(data, list) and all(isinstance(value, t) for item in data for value in item)
 
-    def __check_summarized_result(self):
-        """Check the validation of summary result.
+    def __check_result_values(self):
+        """Check the values of summarized result and raw data in one pass over all metrics.
 
         Return:
-            True if the summary result is instance of List[Number].
+            True if the summarized result is instance of List[Number], and the raw data is:
+              instance of List[List[Number]] for BenchmarkType.MODEL.
+              instance of List[str] for BenchmarkType.DOCKER.
+              instance of List[List[Number]] or List[str] for BenchmarkType.MICRO.
         """
-        for metric in self._result.result:
-            if not self.__is_list_type(self._result.result[metric], numbers.Number):
+        result = self._result.result
+        raw_data = self._result.raw_data
+        allow_str = self._benchmark_type in _STR_RAW_DATA_TYPES
+        allow_numeric = self._benchmark_type in _NUMERIC_RAW_DATA_TYPES
+        check_raw_data = allow_str or allow_numeric
+
+        # Keep the metric order so that the first invalid metric is reported consistently.
+        for metric in dict.fromkeys(itertools.chain(result, raw_data)):
+            if metric in result and not self.__is_list_type(result[metric], _NUMERIC_TYPES):
                 logger.error(
                     'Invalid summarized result - benchmark: {}, metric: {}, result: {}.'.format(
-                        self._name, metric, self._result.result[metric]
+                        self._name, metric, result[metric]
                     )
                 )
                 return False
-
-        return True
-
-    def __check_raw_data(self):
-        """Check the validation of raw data.
-
-        Return:
-            True if the raw data is:
-              instance of List[List[Number]] for BenchmarkType.MODEL.
-              instance of List[str] for BenchmarkType.DOCKER.
-              instance of List[List[Number]] or List[str] for BenchmarkType.MICRO.
-        """
-        for metric in self._result.raw_data:
-            is_valid = True
-            if self._benchmark_type == BenchmarkType.MODEL:
-                is_valid = self.__is_list_list_type(self._result.raw_data[metric], numbers.Number)
-            elif self._benchmark_type == BenchmarkType.DOCKER:
-                is_valid = self.__is_list_type(self._result.raw_data[metric], str)
-            elif self._benchmark_type == BenchmarkType.MICRO:
-                is_valid = self.__is_list_type(self._result.raw_data[metric], str) or self.__is_list_list_type(
-                    self._result.raw_data[metric], numbers.Number
-                )
-            if not is_valid:
+            if check_raw_data and metric in raw_data and \
+                    not (allow_str and self.__is_list_type(raw_data[metric], str)) and \
+                    not (allow_numeric and self.__is_list_list_type(raw_data[metric], _NUMERIC_TYPES)):
                 logger.error(
                     'Invalid raw data type - benchmark: {}, metric: {}, raw data: {}.'.format(
-                        self._name, metric, self._result.raw_data[metric]
+                        self._name, metric, raw_data[metric]
                     )
                 )
                 return False
@@ -82,7 +82,6 @@ def __parse_and_check_args(cls, name, class_def, parameters):
             parameters (str): predefined parameters of benchmark.
         """
         benchmark = class_def(name, parameters)
-        benchmark.add_parser_arguments()
         ret, args, unknown = benchmark.parse_args(ignore_invalid=True)
         if not ret or len(unknown) >= 1:
             logger.log_and_raise(
@@ -170,7 +169,6 @@ def get_benchmark_configurable_settings(cls, benchmark_context):
         (benchmark_class, predefine_params) = cls.__select_benchmark(benchmark_name, platform)
         if benchmark_class:
             benchmark = benchmark_class(benchmark_name)
-            benchmark.add_parser_arguments()
             return benchmark.get_configurable_settings()
         else:
             return None
@@ -136,13 +136,11 @@ def test_arguments_related_interfaces():
     """
     # Positive case for parse_args().
     benchmark = create_benchmark('--num_steps 9')
-    benchmark.add_parser_arguments()
     (ret, args, unknown) = benchmark.parse_args()
     assert (ret and args.num_steps == 9)
 
     # Negative case for parse_args() - invalid precision.
     benchmark = create_benchmark('--num_steps 8 --precision fp32')
-    benchmark.add_parser_arguments()
     (ret, args, unknown) = benchmark.parse_args()
     assert (ret is False)
 
@@ -176,7 +174,8 @@ def test_arguments_related_interfaces():
                         int32 int64.
   --run_count int       The run count of benchmark.
   --sample_count int    The number of data samples in dataset.
-  --seq_len int         Sequence length."""
+  --seq_len int         Sequence length.
+  --skip_result_check   Skip checking the values of result and raw data."""
     )
     assert (settings == expected_settings)
 
@@ -216,7 +215,8 @@ def test_preprocess():
                         int32 int64.
   --run_count int       The run count of benchmark.
   --sample_count int    The number of data samples in dataset.
-  --seq_len int         Sequence length."""
+  --seq_len int         Sequence length.
+  --skip_result_check   Skip checking the values of result and raw data."""
     )
     assert (settings == expected_settings)
 
@@ -364,18 +364,19 @@ def test_check_result_format():
     benchmark._preprocess()
     assert (benchmark._benchmark())
     assert (benchmark._Benchmark__check_result_type())
-    assert (benchmark._Benchmark__check_summarized_result())
-    assert (benchmark._Benchmark__check_raw_data())
+    assert (benchmark._Benchmark__check_result_values())
 
-    # Negative case for __check_result_format() - change List[int] to List[str].
+    # Negative case for __check_result_values() - change List[int] to List[str].
+    result = benchmark._result._BenchmarkResult__result
     benchmark._result._BenchmarkResult__result = {'return_code': [0], 'metric1': ['2.0']}
-    assert (benchmark._Benchmark__check_summarized_result() is False)
+    assert (benchmark._Benchmark__check_result_values() is False)
 
-    # Negative case for __check_raw_data() - change List[List[int]] to List[List[str]].
+    # Negative case for __check_result_values() - change List[List[int]] to List[List[str]].
+    benchmark._result._BenchmarkResult__result = result
     benchmark._result._BenchmarkResult__raw_data = {'metric1': [['2.0']]}
-    assert (benchmark._Benchmark__check_raw_data() is False)
+    assert (benchmark._Benchmark__check_result_values() is False)
 
-    # Negative case for __check_raw_data() - invalid benchmark result.
+    # Negative case for __check_result_format() - invalid benchmark result.
     assert (benchmark._Benchmark__check_result_format() is False)
     assert (benchmark.return_code == ReturnCode.INVALID_BENCHMARK_RESULT)
 
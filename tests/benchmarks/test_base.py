@@ -9,6 +9,8 @@
 import unittest
 from multiprocessing import Process, Queue
 
+import numpy as np
+
 from superbench.benchmarks import BenchmarkType, ReturnCode
 from superbench.benchmarks.base import Benchmark
 
@@ -40,6 +42,70 @@ def test_run(self, pid_queue, rc_queue):
         rc_queue.put(self.return_code)
 
 
+class ResultBenchmark(Benchmark):
+    """Benchmark which adds the given results for test.
+
+    Args:
+        Benchmark (Benchmark): Base Benchmark class.
+    """
+    def __init__(self, name, parameters=''):
+        """Constructor.
+
+        Args:
+            name (str): benchmark name.
+            parameters (str): benchmark parameters.
+        """
+        super().__init__(name, parameters)
+        self._benchmark_type = BenchmarkType.MICRO
+        self._test_results = dict()
+        self._test_raw_data = dict()
+
+    def _benchmark(self):
+        """Implement _benchmark method.
+
+        Returns:
+            bool: True if run benchmark successfully.
+        """
+        for metric, value in self._test_results.items():
+            self._result.add_result(metric, value)
+        for metric, value in self._test_raw_data.items():
+            self._result.add_raw_data(metric, value, False)
+        return True
+
+
+class GridBenchmark(Benchmark):
+    """Benchmark which saves its arguments as results for test.
+
+    Args:
+        Benchmark (Benchmark): Base Benchmark class.
+    """
+    def __init__(self, name, parameters=''):
+        """Constructor.
+
+        Args:
+            name (str): benchmark name.
+            parameters (str): benchmark parameters.
+        """
+        super().__init__(name, parameters)
+        self._benchmark_type = BenchmarkType.MICRO
+
+    def add_parser_arguments(self):
+        """Add the specified arguments."""
+        super().add_parser_arguments()
+        self._parser.add_argument('--size', type=int, default=1, required=False, help='Size.')
+        self._parser.add_argument('--scales', type=float, nargs='+', default=[1.0], required=False, help='Scales.')
+
+    def _benchmark(self):
+        """Implement _benchmark method.
+
+        Returns:
+            bool: True if run benchmark successfully.
+        """
+        for scale in self._args.scales:
+            self._result.add_result('size_{}'.format(scale), self._args.size * scale)
+        return True
+
+
 class BenchmarkBaseTestCase(unittest.TestCase):
     """A class for benchmark base test cases."""
     def setUp(self):
@@ -75,3 +141,192 @@ def test_signal_handler(self):
                     killer.join()
                 proc.join()
                 self.assertEqual(self.rc_queue.get(block=True, timeout=3), test_case['return_code'])
+
+    def test_parser_template(self):
+        """Test parser template is built once and shared by instances of the same class."""
+        benchmark = FooBenchmark('foo', parameters='--run_count 2')
+        ret, args, unknown = benchmark.parse_args()
+        self.assertTrue(ret)
+        self.assertEqual(args.run_count, 2)
+        template = FooBenchmark._parser_template
+        self.assertIsNotNone(template)
+        self.assertIsNot(benchmark._parser, template)
+
+        another = FooBenchmark('foo')
+        ret, args, unknown = another.parse_args()
+        self.assertTrue(ret)
+        self.assertEqual(args.run_count, 1)
+        self.assertIs(FooBenchmark._parser_template, template)
+        self.assertIsNone(Benchmark._parser_template)
+
+    def test_fast_parse(self):
+        """Test fast parsing path gets the same arguments as argparse."""
+        test_cases = [
+            '',
+            '--run_count 2 --duration 10',
+            '--run_count=3 --log_raw_data',
+            '--log_flushing --run_count 4 --run_count 5',
+        ]
+        for parameters in test_cases:
+            with self.subTest(msg='Testing with case', parameters=parameters):
+                benchmark = FooBenchmark('foo', parameters=parameters)
+                args = benchmark._fast_parse()
+                self.assertIsNotNone(args)
+                benchmark._init_parser()
+                expected_args, unknown = benchmark._parser.parse_known_args(benchmark._argv)
+                self.assertEqual(vars(args), vars(expected_args))
+                self.assertEqual(unknown, [])
+
+        # Fall back to argparse for unknown or invalid arguments.
+        for parameters in ['--foo 1', '--run_count abc', '--run_count -1', '--log_raw_data=1', '--duration']:
+            with self.subTest(msg='Testing with case', parameters=parameters):
+                benchmark = FooBenchmark('foo', parameters=parameters)
+                self.assertIsNone(benchmark._fast_parse())
+        ret, args, unknown = FooBenchmark('foo', parameters='--run_count -1').parse_args()
+        self.assertTrue(ret)
+        self.assertEqual(args.run_count, -1)
+        ret, args, unknown = FooBenchmark('foo', parameters='--run_count 1 --foo 1').parse_args()
+        self.assertFalse(ret)
+        self.assertEqual(unknown, ['--foo', '1'])
+
+    def test_get_configurable_settings(self):
+        """Test configurable settings are formatted once per class."""
+        settings = self.benchmark.get_configurable_settings()
+        self.assertTrue(settings.startswith('optional arguments:'))
+        self.assertIn('--run_count int', settings)
+        self.assertEqual(FooBenchmark._configurable_settings, settings)
+        self.assertIs(FooBenchmark('foo').get_configurable_settings(), settings)
+        self.assertIsNone(self.benchmark._parser)
+        self.assertNotIn('\033[', settings)
+        self.assertFalse(getattr(Benchmark._create_parser(), 'color', False))
+
+    def test_check_result_format(self):
+        """Test result format checking with different numeric types."""
+        benchmark = ResultBenchmark('result')
+        benchmark._test_results = {
+            'int': 1,
+            'float': 1.5,
+            'bool': True,
+            'np_int': np.int64(2),
+            'np_float': np.float32(0.5)
+        }
+        benchmark._test_raw_data = {'numbers': [1, 2.0, np.int32(3)], 'str': 'raw output'}
+        self.assertTrue(benchmark.run())
+        self.assertEqual(benchmark.return_code, ReturnCode.SUCCESS)
+
+        benchmark = ResultBenchmark('result')
+        benchmark._test_results = {'str': '1'}
+        self.assertFalse(benchmark.run())
+        self.assertEqual(benchmark.return_code, ReturnCode.INVALID_BENCHMARK_RESULT)
+
+        benchmark = ResultBenchmark('result')
+        benchmark._test_raw_data = {'str': ['1', 2]}
+        self.assertFalse(benchmark.run())
+        self.assertEqual(benchmark.return_code, ReturnCode.INVALID_BENCHMARK_RESULT)
+
+        benchmark = ResultBenchmark('result', parameters='--skip_result_check')
+        benchmark._test_results = {'str': '1'}
+        self.assertTrue(benchmark.run())
+        self.assertEqual(benchmark.return_code, ReturnCode.SUCCESS)
+
+    def test_check_raw_data_with_types(self):
+        """Test raw data checking for different benchmark types."""
+        test_cases = [
+            (BenchmarkType.MICRO, 'raw output', True),
+            (BenchmarkType.MICRO, [1, 2.0], True),
+            (BenchmarkType.DOCKER, 'raw output', True),
+            (BenchmarkType.DOCKER, [1, 2.0], False),
+            (BenchmarkType.MODEL, 'raw output', False),
+            (BenchmarkType.MODEL, [1, 2.0], True),
+        ]
+        for benchmark_type, raw_data, expected in test_cases:
+            with self.subTest(msg='Testing with case', benchmark_type=benchmark_type, raw_data=raw_data):
+                benchmark = ResultBenchmark('result')
+                benchmark._benchmark_type = benchmark_type
+                benchmark._test_raw_data = {'metric': raw_data}
+                self.assertEqual(benchmark.run(), expected)
+
+    def test_timestamp(self):
+        """Test start and end timestamps of benchmarking."""
+        benchmark = ResultBenchmark('result')
+        self.assertTrue(benchmark.run())
+        for timestamp in [benchmark.start_time, benchmark.end_time]:
+            self.assertEqual(
+                time.strftime('%Y-%m-%d %H:%M:%S', time.strptime(timestamp, '%Y-%m-%d %H:%M:%S')), timestamp
+            )
+        self.assertLessEqual(benchmark.start_time, benchmark.end_time)
+
+    def test_split_parameters(self):
+        """Test splitting parameters into arguments."""
+        test_cases = {
+            None: [],
+            '': [],
+            '  --run_count  2 \t--log_raw_data\n': ['--run_count', '2', '--log_raw_data'],
+            '--foo "a b" --bar \'\'': ['--foo', 'a b', '--bar'],
+            '--foo a\\ b': ['--foo', 'a b'],
+        }
+        for parameters, argv in test_cases.items():
+            with self.subTest(msg='Testing with case', parameters=parameters):
+                self.assertEqual(FooBenchmark('foo', parameters=parameters)._argv, argv)
+
+    def test_slots(self):
+        """Test attributes of the base class are stored in slots."""
+        for attr in Benchmark.__slots__:
+            self.assertNotIn(attr, vars(self.benchmark))
+        self.assertEqual(self.benchmark._name, 'foo')
+
+    def test_preprocess(self):
+        """Test return code and run count set by _preprocess()."""
+        benchmark = FooBenchmark('foo', parameters='--run_count 3')
+        benchmark._benchmark_type = BenchmarkType.MICRO
+        self.assertTrue(benchmark._preprocess())
+        self.assertEqual(benchmark.return_code, ReturnCode.SUCCESS)
+        self.assertEqual(benchmark.run_count, 3)
+
+        benchmark = FooBenchmark('foo', parameters='--run_count 3')
+        self.assertFalse(benchmark._preprocess())
+        self.assertEqual(benchmark.return_code, ReturnCode.INVALID_BENCHMARK_TYPE)
+        self.assertEqual(benchmark.run_count, 3)
+
+        benchmark = FooBenchmark('foo', parameters='--run_count x')
+        benchmark._benchmark_type = BenchmarkType.MICRO
+        self.assertFalse(benchmark._preprocess())
+        self.assertEqual(benchmark.return_code, ReturnCode.INVALID_ARGUMENT)
+        self.assertEqual(benchmark.run_count, 0)
+
+    def test_run_count(self):
+        """Test _benchmark() is invoked run_count times."""
+        benchmark = ResultBenchmark('result', parameters='--run_count 3')
+        benchmark._test_results = {'metric': 1}
+        self.assertTrue(benchmark.run())
+        self.assertEqual(benchmark.result['metric'], [1, 1, 1])
+        self.assertEqual(benchmark._curr_run_index, 2)
+
+    def test_run_many(self):
+        """Test running benchmark with a parameter grid."""
+        param_grid = [
+            {},
+            {
+                'size': 2,
+                'scales': [1.0, 0.5]
+            },
+            {
+                'size': 4,
+                'run_count': 2,
+                'log_flushing': True,
+                'log_raw_data': False,
+                'scales': None
+            },
+        ]
+        benchmarks = GridBenchmark.run_many('grid', param_grid, parameters='--scales 2')
+        self.assertEqual(len(benchmarks), 3)
+        for benchmark in benchmarks:
+            self.assertEqual(benchmark.return_code, ReturnCode.SUCCESS)
+        self.assertEqual(benchmarks[0].result['size_2.0'], [2.0])
+        self.assertEqual(benchmarks[1].result['size_1.0'], [2.0])
+        self.assertEqual(benchmarks[1].result['size_0.5'], [1.0])
+        self.assertEqual(benchmarks[2].result['size_2.0'], [8.0, 8.0])
+        self.assertTrue(benchmarks[2]._args.log_flushing)
+
+        benchmarks = GridBenchmark.run_many('grid', [{'size': 'x'}])
+        self.assertEqual(benchmarks[0].return_code, ReturnCode.INVALID_ARGUMENT)
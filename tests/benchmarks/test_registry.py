@@ -113,13 +113,14 @@ def test_get_benchmark_configurable_settings():
     settings = BenchmarkRegistry.get_benchmark_configurable_settings(context)
 
     expected = """optional arguments:
-  --duration int     The elapsed time of benchmark in seconds.
-  --log_flushing     Real-time log flushing.
-  --log_raw_data     Log raw data into file instead of saving it into result
-                     object.
-  --lower_bound int  The lower bound for accumulation.
-  --run_count int    The run count of benchmark.
-  --upper_bound int  The upper bound for accumulation."""
+  --duration int       The elapsed time of benchmark in seconds.
+  --log_flushing       Real-time log flushing.
+  --log_raw_data       Log raw data into file instead of saving it into result
+                       object.
+  --lower_bound int    The lower bound for accumulation.
+  --run_count int      The run count of benchmark.
+  --skip_result_check  Skip checking the values of result and raw data.
+  --upper_bound int    The upper bound for accumulation."""
     assert (settings == expected)
 
 